@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import Final_codepythonnnnn as app  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def backend(tmp_path):
+    # every test gets its own SQLite file and default settings
+    config, dedup = dict(app.DB_CONFIG), dict(app.DEDUP_CONFIG)
+    app.configure_backend(driver="sqlite", dsn=f"sqlite:///{tmp_path / 'menu.db'}")
+    app.configure_write_behind(False)
+    app.read_cache.ttl = 60
+    yield app
+    app.configure_write_behind(False)
+    app.DEDUP_CONFIG.update(dedup)
+    app.configure_backend(driver=config["driver"], dsn=config["dsn"])
+
+
+@pytest.fixture
+def menu():
+    rows = [(1, "Monday", "Lunch", "rice"), (2, "Monday", "Lunch", "dal"), (3, "Tuesday", "Dinner", "roti")]
+    assert app.add_menu_many(rows)["status"] == "success"
+    return rows
+
+
+@pytest.fixture
+def add_review():
+    def add(menu_id, text):
+        # ad() does not return the new id; it is the newest review of the menu
+        assert app.ad(menu_id, text)["status"] == "success"
+        return max(r["review_id"] for r in app.get_reviews(menu_id)["reviews"])
+    return add
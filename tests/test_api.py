@@ -0,0 +1,111 @@
+import asyncio
+import http.client
+import json
+import threading
+
+import pytest
+
+import Final_codepythonnnnn as app
+
+
+@pytest.fixture
+def api():
+    # start_api(token) runs an ApiServer on a free port in a background loop and returns request()
+    servers = []
+
+    def start_api(token="secret"):
+        srv = app.ApiServer(token=token, workers=2)
+        loop = asyncio.new_event_loop()
+        state, started = {}, threading.Event()
+
+        async def start():
+            state["server"] = await asyncio.start_server(srv.handle, "127.0.0.1", 0)
+            state["port"] = state["server"].sockets[0].getsockname()[1]
+            started.set()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(start())
+            loop.run_forever()
+
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        assert started.wait(5)
+        servers.append((srv, loop, state, t))
+
+        def request(method, path, body=None, headers=None):
+            conn = http.client.HTTPConnection("127.0.0.1", state["port"], timeout=5)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                resp = conn.getresponse()
+                return resp.status, dict(resp.getheaders()), resp.read()
+            finally:
+                conn.close()
+        return request
+
+    yield start_api
+
+    async def stop(state):
+        state["server"].close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for srv, loop, state, t in servers:
+        asyncio.run_coroutine_threadsafe(stop(state), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        t.join(5)
+        loop.close()
+        srv.executor.shutdown(wait=True)
+
+
+def test_admin_writes_need_the_token(api, menu):
+    request = api("secret")
+    app.ad(1, "the rice was soft and fresh")
+    assert request("POST", "/api/del_review", body=b'{"menuid": 1}')[0] == 401
+    assert request("POST", "/api/del_review", body=b'{"menuid": 1}', headers={"Authorization": "Bearer nope"})[0] == 401
+    assert len(app.get_reviews(1)["reviews"]) == 1
+    status, _, _ = request("POST", "/api/ad", body=b'{"menu_id": 2, "review_text": "the dal was thick and hot"}')
+    assert status == 200
+    status, _, _ = request("POST", "/api/del_review", body=b'{"menuid": 1}', headers={"Authorization": "Bearer secret"})
+    assert status == 200
+    assert app.get_reviews(1)["reviews"] == []
+
+
+def test_admin_functions_refused_without_a_configured_token(api, menu):
+    request = api("")
+    status, _, body = request("POST", "/api/del_menu", body=b'{"menuid": 1}')
+    assert status == 403 and b"MESS_API_TOKEN" in body
+    assert request("GET", "/api/metrics_snapshot")[0] == 403
+    assert len(app.get_full_menu()["menu"]) == 3
+    assert request("POST", "/api/ad", body=b'{"menu_id": 1, "review_text": "rice was nice and hot"}')[0] == 200
+
+
+def test_get_etag_and_not_modified(api, menu):
+    request = api()
+    status, headers, body = request("GET", "/api/get_full_menu")
+    assert status == 200 and body
+    etag = headers["ETag"]
+    status, _, body = request("GET", "/api/get_full_menu", headers={"If-None-Match": etag})
+    assert status == 304 and body == b""
+    app.add_menu(4, "Friday", "Lunch", "pulao")
+    status, headers, _ = request("GET", "/api/get_full_menu", headers={"If-None-Match": etag})
+    assert status == 200 and headers["ETag"] != etag
+
+
+def test_query_values_keep_their_text(api, menu):
+    request = api()
+    app.add_menu(4, "Friday", "Lunch", "007")
+    status, _, body = request("GET", "/api/get_menu_for?day=Friday&meal=Lunch")
+    assert status == 200 and json.loads(body)["menu"][0]["item"] == "007"
+    app.ad(1, "the rice was soft and fresh")
+    body = json.loads(request("GET", "/api/get_reviews?menuid=1&include_archived=false")[2])
+    assert len(body["reviews"]) == 1
+    assert request("GET", "/api/get_reviews?menuid=one")[0] == 400
+
+
+def test_unknown_function_and_wrong_method(api):
+    request = api()
+    assert request("GET", "/api/nope")[0] == 404
+    assert request("GET", "/api/ad")[0] == 405
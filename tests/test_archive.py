@@ -0,0 +1,56 @@
+import pytest
+
+import Final_codepythonnnnn as app
+
+
+@pytest.fixture
+def old_reviews(menu):
+    # two terms (2020_1, 2020_2) plus one recent review
+    app.add_reviews_many([(1, "old rice", "2020-02-01 10:00:00"), (1, "older rice", "2020-01-01 10:00:00"),
+                          (2, "old dal", "2020-08-01 10:00:00"), (1, "new rice")])
+
+
+def test_archive_moves_old_reviews_by_term(old_reviews):
+    res = app.archive_reviews(older_than_days=30, batch_size=10, pause=0)
+    assert res["status"] == "success" and res["archived"] == 3
+    assert res["terms"] == {"2020_1": 2, "2020_2": 1}
+    assert [r["text"] for r in app.get_reviews(1)["reviews"]] == ["new rice"]
+    assert sorted(r["text"] for r in app.get_reviews(1, include_archived=True)["reviews"]) == \
+        ["new rice", "old rice", "older rice"]
+    assert app.get_review_stats([1, 2])["stats"][2]["review_count"] == 0
+    archives = {a["term"]: a for a in app.list_archives()["archives"]}
+    assert archives["2020_1"]["row_count"] == 2 and archives["2020_1"]["kind"] == "table"
+
+
+def test_small_batches_span_terms(old_reviews):
+    res = app.archive_reviews(older_than_days=30, batch_size=1, pause=0)
+    assert res["archived"] == 3 and res["batches"] == 3
+
+
+def test_rerun_after_a_partial_copy(old_reviews):
+    # a copy that reached the archive while the hot row stayed (e.g. an interrupted run)
+    with app.db_cursor() as (conn, cur):
+        cur.execute("SELECT review_id, menu_id, review_text, created_at FROM reviews WHERE review_text = 'old rice'")
+        row = cur.fetchone()
+    app._ensure_archive_tables({"2020_1"})
+    with app.db_cursor() as (conn, cur):
+        app._archive_rows(cur, [row])
+        conn.commit()
+    res = app.archive_reviews(older_than_days=30, batch_size=10, pause=0)
+    assert res["status"] == "success" and res["archived"] == 3
+    archives = {a["term"]: a for a in app.list_archives()["archives"]}
+    assert archives["2020_1"]["row_count"] == 2
+    texts = [r["text"] for r in app.get_reviews(1, include_archived=True)["reviews"]]
+    assert sorted(texts) == ["new rice", "old rice", "older rice"]
+
+
+def test_file_archives(tmp_path, old_reviews):
+    res = app.archive_reviews(older_than_days=30, mode="files", archive_dir=str(tmp_path / "arc"), pause=0)
+    assert res["archived"] == 3
+    assert sorted(p.name for p in (tmp_path / "arc").iterdir()) == ["reviews_2020_1.db", "reviews_2020_2.db"]
+    assert [r["text"] for r in app.get_reviews(2, include_archived=True)["reviews"]] == ["old dal"]
+
+
+def test_nothing_to_archive(menu):
+    assert app.archive_reviews(older_than_days=30, pause=0)["archived"] == 0
+    assert app.archive_reviews(mode="tape")["status"] == "error"
@@ -0,0 +1,47 @@
+import Final_codepythonnnnn as app
+
+
+def test_repeated_read_is_a_hit(menu):
+    app.get_full_menu()
+    hits = app.read_cache.stats()["hits"]
+    app.get_full_menu()
+    assert app.read_cache.stats()["hits"] == hits + 1
+
+
+def test_menu_writes_invalidate(menu):
+    assert len(app.get_full_menu()["menu"]) == 3
+    app.add_menu(4, "Friday", "Lunch", "pulao")
+    assert len(app.get_full_menu()["menu"]) == 4
+    app.upd_menu_fields(4, item="biryani")
+    assert app.get_menu_for("Friday", "Lunch")["menu"][0]["item"] == "biryani"
+    app.del_menu(4)
+    assert [m["id"] for m in app.get_full_menu()["menu"]] == [1, 2, 3]
+
+
+def test_review_writes_invalidate(menu, add_review):
+    assert app.get_reviews(1)["reviews"] == []
+    rid = add_review(1, "the rice was soft and fresh")
+    assert [r["text"] for r in app.get_reviews(1)["reviews"]] == ["the rice was soft and fresh"]
+    app.upd_review_by_id(rid, "the rice was cold today sadly")
+    assert [r["text"] for r in app.get_reviews(1)["reviews"]] == ["the rice was cold today sadly"]
+    app.del_review_by_id(rid)
+    assert app.get_reviews(1)["reviews"] == []
+
+
+def test_store_skipped_after_concurrent_invalidate():
+    cache = app.ReadCache(ttl=60)
+    _, gen = cache.lookup("g", "k")
+    cache.invalidate("g")   # a write landed while the value was being loaded
+    cache.store("g", "k", gen, {"status": "success", "v": 1})
+    assert cache.lookup("g", "k")[0] is None
+
+
+def test_entries_expire_and_evict():
+    cache = app.ReadCache(ttl=-1)
+    cache.store("g", "k", 0, {"status": "success"})
+    assert cache.lookup("g", "k")[0] is None
+    cache = app.ReadCache(ttl=60, max_entries=2)
+    for k in "abc":
+        cache.store("g", k, 0, {"status": "success", "k": k})
+    assert cache.lookup("g", "a")[0] is None and cache.lookup("g", "c")[0]["k"] == "c"
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,45 @@
+import Final_codepythonnnnn as app
+
+
+def test_changes_since_returns_newest_state(menu, add_review):
+    start = app.get_changes_since(None)
+    assert start["reset"] and start["changes"] == []
+    rid = add_review(1, "the rice was soft and fresh")
+    app.upd_menu_fields(2, item="paneer")
+    app.upd_menu_fields(2, item="chole")
+    res = app.get_changes_since(start["version"])
+    assert not res["reset"]
+    got = {(c["entity"], c["id"]): c for c in res["changes"]}
+    assert got[("menu", 2)]["row"]["item"] == "chole"
+    assert got[("review", rid)]["op"] == "upsert"
+    assert app.get_changes_since(res["version"])["changes"] == []
+
+
+def test_deletes_are_reported(menu, add_review):
+    rid = add_review(1, "the rice was soft and fresh")
+    start = app.get_changes_since(None)["version"]
+    app.del_review_by_id(rid)
+    app.del_menu(3)
+    got = {(c["entity"], c["id"]): c["op"] for c in app.get_changes_since(start)["changes"]}
+    assert got == {("review", rid): "delete", ("menu", 3): "delete"}
+
+
+def test_changes_since_reset_after_compaction(menu):
+    old = app.get_changes_since(None)["version"]
+    app.upd_menu_fields(1, item="jeera rice")
+    app.upd_menu_fields(1, item="lemon rice")
+    res = app.compact_change_log(keep_seconds=-1)
+    assert res["status"] == "success" and res["horizon"] > old
+    stale = app.get_changes_since(old)
+    assert stale["reset"] and stale["version"] == res["horizon"]
+    app.upd_menu_fields(3, item="naan")
+    fresh = app.get_changes_since(stale["version"])
+    assert not fresh["reset"]
+    assert [(c["id"], c["row"]["item"]) for c in fresh["changes"]] == [(3, "naan")]
+
+
+def test_compaction_drops_superseded_entries(menu):
+    for item in ("a", "b", "c"):
+        app.upd_menu_fields(1, item=item)
+    res = app.compact_change_log()
+    assert res["superseded"] == 3 and res["expired"] == 0   # the insert and the first two updates
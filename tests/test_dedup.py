@@ -0,0 +1,54 @@
+import Final_codepythonnnnn as app
+
+
+def fingerprints():
+    with app.db_cursor() as (conn, cur):
+        cur.execute("SELECT review_id, duplicate_of FROM review_fingerprints ORDER BY review_id")
+        return cur.fetchall()
+
+
+def test_duplicate_review_rejected(menu, add_review):
+    app.configure_dedup(action="reject", scope="menu")
+    first = add_review(1, "the rice was very good today")
+    dup = app.ad(1, "The rice was very good today!")
+    assert dup["status"] == "error" and dup["duplicate_of"] == first
+    assert app.ad(2, "the rice was very good today")["status"] == "success"
+    assert len(app.get_reviews(1)["reviews"]) == 1
+
+
+def test_duplicate_review_flagged(menu, add_review):
+    app.configure_dedup(action="flag", scope="menu")
+    first = add_review(1, "the rice was very good today")
+    res = app.ad(1, "the rice was very good today")
+    assert res["status"] == "success" and res["flagged"] and res["duplicate_of"] == first
+    assert [r["duplicate_of"] for r in app.get_flagged_reviews(1)["reviews"]] == [first]
+
+
+def test_rescan_flags_only_later_copies(menu, add_review):
+    app.configure_dedup(action="off")
+    first = add_review(1, "the dal was thick and hot")
+    second = add_review(1, "the dal was thick and hot")
+    add_review(1, "the roti was burnt at the edges")
+    assert fingerprints() == []
+    app.configure_dedup(action="flag", scope="menu")
+    assert app.rescan_fingerprints(batch_size=2) == {"status": "success", "scanned": 3, "flagged": 1}
+    assert (first, None) in fingerprints() and (second, first) in fingerprints()
+    assert app.rescan_fingerprints(batch_size=1)["flagged"] == 1   # a repeat run does not flag the original
+    assert len(fingerprints()) == 3
+
+
+def test_rescan_keeps_fingerprints_of_rows_not_yet_rebuilt(menu, add_review, monkeypatch):
+    app.configure_dedup(action="reject", scope="menu")
+    add_review(1, "the rice was very good today")
+    add_review(1, "the dal was thick and hot")
+    epoch, checks = app._epoch, []
+
+    def during_rescan(created_at):
+        if not checks:   # the first batch is open; the dal review has not been rebuilt yet
+            checks.append(app.ad(1, "the dal was thick and hot")["status"])
+        return epoch(created_at)
+    monkeypatch.setattr(app, "_epoch", during_rescan)
+    assert app.rescan_fingerprints(batch_size=1)["status"] == "success"
+    assert checks == ["error"]
+    assert app.ad(1, "the rice was very good today")["status"] == "error"
+    assert len(app.get_reviews(1)["reviews"]) == 2
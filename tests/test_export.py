@@ -0,0 +1,41 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+import Final_codepythonnnnn as app
+
+
+@pytest.fixture
+def reviews(menu):
+    app.add_reviews_many([(1, "rice one", "2025-01-05 10:00:00"), (2, "dal, with a comma", "2025-02-05 10:00:00"),
+                          (3, "roti", "2025-03-05 10:00:00")])
+
+
+def test_csv_round_trips_through_import(tmp_path, reviews):
+    path = str(tmp_path / "reviews.csv")
+    res = app.export_data("reviews", path, fetch_size=1)
+    assert res["status"] == "success" and res["rows"] == 3
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["review_text"] for r in rows] == ["rice one", "dal, with a comma", "roti"]
+    app.del_review(1)
+    assert app.import_file(path, "reviews")["status"] == "success"
+    assert [r["text"] for r in app.get_reviews(1)["reviews"]] == ["rice one"]
+
+
+def test_filters_and_gzip_jsonl(tmp_path, reviews):
+    path = str(tmp_path / "reviews.jsonl.gz")
+    res = app.export_data("reviews", path, created_from="2025-02-01", created_to="2025-03-01")
+    assert res["rows"] == 1
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [(r["menu_id"], r["day"], r["meal"]) for r in rows] == [(2, "Monday", "Lunch")]
+    assert app.export_data("reviews", str(tmp_path / "lunch.jsonl"), day="Monday", meal="Lunch")["rows"] == 2
+
+
+def test_columnar_reads_back(tmp_path, reviews):
+    path = str(tmp_path / "menu.col")
+    assert app.export_data("menu", path, fmt="columnar", fetch_size=2)["rows"] == 3
+    assert list(app.iter_columnar(path)) == app.get_full_menu()["menu"]
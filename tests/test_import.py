@@ -0,0 +1,29 @@
+import json
+
+import Final_codepythonnnnn as app
+
+
+def test_add_menu_many_reports_bad_rows():
+    res = app.add_menu_many([(1, "Monday", "Lunch", "rice"), ("x", "Monday", "Lunch", "dal"),
+                             {"id": 2, "day": "Monday", "meal": "Dinner", "item": "roti"}, (1, "Tuesday", "Lunch", "dup")])
+    assert res["status"] == "partial" and res["inserted"] == 2
+    assert [e["row"] for e in res["errors"]] == [1, 3]
+    assert [m["item"] for m in app.get_full_menu()["menu"]] == ["rice", "roti"]
+
+
+def test_add_reviews_many_reports_bad_rows(menu):
+    res = app.add_reviews_many([(1, "good rice"), {"menu_id": 1, "text": "cold rice"}, (2, None)])
+    assert res["inserted"] == 2 and [e["row"] for e in res["errors"]] == [2]
+    assert sorted(r["text"] for r in app.get_reviews(1)["reviews"]) == ["cold rice", "good rice"]
+
+
+def test_import_file_csv_and_jsonl(tmp_path):
+    menu_csv = tmp_path / "menu.csv"
+    menu_csv.write_text("id,day,meal,item\n1,Monday,Lunch,rice\n2,Monday,Lunch,dal\nbad,Monday,Lunch,x\n")
+    res = app.import_file(str(menu_csv), "menu", chunk_size=2)
+    assert res["inserted"] == 2 and [e["row"] for e in res["errors"]] == [2]
+
+    reviews = tmp_path / "reviews.jsonl"
+    reviews.write_text("\n".join(json.dumps({"menu_id": 2, "review_text": f"dal {i}"}) for i in range(5)) + "\n")
+    assert app.import_file(str(reviews), "reviews", chunk_size=2) == {"status": "success", "inserted": 5, "errors": []}
+    assert len(app.get_reviews(2)["reviews"]) == 5
@@ -0,0 +1,19 @@
+import pytest
+
+import Final_codepythonnnnn as app
+
+
+def test_parse_load_mix():
+    assert app.parse_load_mix("ad=3, get_reviews") == {"ad": 3.0, "get_reviews": 1.0}
+    for bad in ("nope=1", "ad=0", ""):
+        with pytest.raises(ValueError):
+            app.parse_load_mix(bad)
+
+
+def test_worker_setup_failure_is_reported(tmp_path):
+    opts = {"duration": 0.2, "mix": {"get_menu_for": 1.0}, "menus": 5, "reviews": 5, "seed": 1,
+            "sqlite_profile": "tuned", "retry": dict(app.RETRY_POLICY), "cache_ttl": 0}
+    level = app._load_level(2, f"sqlite:///{tmp_path / 'missing' / 'menu.db'}", opts)
+    assert level["finished"] == 0 and level["n"] == 0
+    assert len(level["failures"]) == 2
+    assert all("setup failed" in f for f in level["failures"])
@@ -0,0 +1,16 @@
+import Final_codepythonnnnn as app
+
+
+def test_get_menu_for_returns_only_the_slot(menu):
+    res = app.get_menu_for("Monday", "Lunch")
+    assert res["status"] == "success"
+    assert [(m["id"], m["item"]) for m in res["menu"]] == [(1, "rice"), (2, "dal")]
+    assert app.get_menu_for("Sunday", "Lunch")["menu"] == []
+
+
+def test_get_menu_for_uses_the_day_meal_index(menu):
+    with app.db_cursor() as (conn, cur):
+        cur.execute("EXPLAIN QUERY PLAN SELECT id, day, meal, item FROM menu WHERE day = ? AND meal = ? ORDER BY id",
+                    ("Monday", "Lunch"))
+        plan = " ".join(str(r[-1]) for r in cur.fetchall())
+    assert "idx_menu_day_meal" in plan
@@ -0,0 +1,23 @@
+import Final_codepythonnnnn as app
+
+
+def test_several_columns_in_one_update(menu):
+    res = app.upd_menu_fields(1, day="Friday", meal="Dinner", item="pulao")
+    assert res["status"] == "success" and res["changed"] == ["day", "meal", "item"]
+    assert res["menu"] == {"id": 1, "day": "Friday", "meal": "Dinner", "item": "pulao"}
+    assert app.get_menu_for("Friday", "Dinner")["menu"] == [res["menu"]]
+
+
+def test_unchanged_values_are_not_written(menu):
+    version = app.get_changes_since(None)["version"]
+    res = app.upd_menu_fields(2, day="Monday", item="dal")
+    assert res["status"] == "success" and res["changed"] == []
+    assert app.get_changes_since(version)["changes"] == []
+
+
+def test_bad_arguments(menu):
+    assert app.upd_menu_fields(1, colour="red")["status"] == "error"
+    assert app.upd_menu_fields(1)["status"] == "error"
+    assert app.upd_menu_fields(99, item="x")["status"] == "error"
+    assert app.upd_menu_fields(1, password="p", item="x")["status"] == "denied"
+    assert app.get_full_menu()["menu"][0]["item"] == "rice"
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+import Final_codepythonnnnn as app
+
+
+def test_released_connection_is_reused():
+    pool = app.ensure_backend()
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first
+
+
+def test_nested_checkout_shares_connection():
+    pool = app.ensure_backend()
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+
+
+def test_threads_get_their_own_connections():
+    pool = app.ensure_backend()
+    seen, ready, done = [], threading.Barrier(2), threading.Event()
+
+    def worker():
+        with pool.connection() as c:
+            seen.append(c)
+            ready.wait(5)
+            done.wait(5)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    with pool.connection() as mine:
+        ready.wait(5)
+        assert seen[0] is not mine
+    done.set()
+    t.join(5)
+
+
+def test_broken_connection_is_discarded():
+    pool = app.ensure_backend()
+    with pool.connection() as c:
+        pass
+    c.close()   # rollback on release fails, so the connection must not go back to the pool
+    with pytest.raises(Exception):
+        with pool.connection() as same:
+            same.execute("SELECT 1")
+    with pool.connection() as fresh:
+        assert fresh is not c
+        assert fresh.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_exhausted_pool_times_out():
+    app.ensure_backend()
+    pool = app.ConnectionPool(app._connect, "sqlite", max_size=1, timeout=0.05)
+    c = pool.acquire()
+    try:
+        with pytest.raises(app.PoolTimeout):
+            pool.acquire()
+    finally:
+        pool.release(c, broken=True)
+
+
+def test_uncommitted_work_is_rolled_back_on_release(menu):
+    with app.db_cursor() as (conn, cur):
+        cur.execute("DELETE FROM menu")
+    assert len(app.get_full_menu()["menu"]) == 3
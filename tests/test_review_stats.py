@@ -0,0 +1,40 @@
+import Final_codepythonnnnn as app
+
+
+def stats(menu_id):
+    return app.get_review_stats([menu_id])["stats"][menu_id]
+
+
+def test_stats_follow_inserts_updates_and_deletes(menu, add_review):
+    assert stats(1)["review_count"] == 0
+    first = add_review(1, "rice was good")        # 13 characters
+    add_review(1, "rice was cold and very hard")   # 27 characters
+    s = stats(1)
+    assert (s["review_count"], s["min_length"], s["max_length"], s["avg_length"]) == (2, 13, 27, 20.0)
+    assert s["last_review_at"] is not None
+    app.upd_review_by_id(first, "rice ok")
+    assert stats(1)["min_length"] == 7
+    app.del_review_by_id(first)
+    assert (stats(1)["review_count"], stats(1)["min_length"]) == (1, 27)
+    app.del_review(1)
+    assert stats(1)["review_count"] == 0
+
+
+def test_stats_match_a_full_recount(menu):
+    app.add_reviews_many([(m, "x" * (m * 10 + i)) for m in (1, 2) for i in range(5)])
+    app.ad(2, "the dal was very thick today")
+    before = app.get_review_stats("1,2,3")["stats"]
+    with app.db_cursor() as (conn, cur):
+        app._refresh_review_stats(cur, [1, 2, 3])
+        conn.commit()
+    assert app.get_review_stats([1, 2, 3])["stats"] == before
+    assert before[2]["review_count"] == 6 and before[3]["review_count"] == 0
+
+
+def test_stats_backfilled_for_an_existing_database(tmp_path, menu, add_review):
+    add_review(1, "rice was good")
+    with app.db_cursor() as (conn, cur):
+        cur.execute("DELETE FROM review_stats")
+        conn.commit()
+    app.configure_backend(dsn=app.DB_CONFIG["dsn"])   # reopen: startup rebuilds the empty table
+    assert stats(1)["review_count"] == 1
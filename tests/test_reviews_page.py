@@ -0,0 +1,44 @@
+import Final_codepythonnnnn as app
+
+
+def page_through(menu_id, limit):
+    texts, after = [], None
+    while True:
+        res = app.get_reviews_page(menu_id, after, limit)
+        assert res["status"] == "success"
+        texts += [r["text"] for r in res["reviews"]]
+        after = res["next_after"]
+        if after is None:
+            return texts
+
+
+def test_pages_cover_every_review_once_in_order(menu):
+    rows = [(1, f"review {i}", f"2025-01-{1 + i // 3:02d} 10:00:00") for i in range(10)]
+    assert app.add_reviews_many(rows)["inserted"] == 10
+    assert page_through(1, 3) == [f"review {i}" for i in range(10)]
+    assert page_through(1, 100) == [f"review {i}" for i in range(10)]
+
+
+def test_cursor_survives_deleting_its_review(menu):
+    app.add_reviews_many([(1, f"review {i}", f"2025-01-01 10:00:0{i}") for i in range(6)])
+    first = app.get_reviews_page(1, None, 2)
+    app.del_review_by_id(first["reviews"][-1]["review_id"])
+    res = app.get_reviews_page(1, first["next_after"], 2)
+    assert res["status"] == "success"
+    assert [r["text"] for r in res["reviews"]] == ["review 2", "review 3"]
+
+
+def test_cursor_accepts_a_pair(menu):
+    app.add_reviews_many([(1, f"review {i}", f"2025-01-01 10:00:0{i}") for i in range(3)])
+    res = app.get_reviews_page(1, ["2025-01-01 10:00:00", 1], 5)
+    assert [r["text"] for r in res["reviews"]] == ["review 1", "review 2"]
+    assert app.get_reviews_page(1, "garbage", 5)["status"] == "error"
+
+
+def test_bulk_created_at_is_normalised(menu):
+    res = app.add_reviews_many([(1, "iso", "2025-03-01T09:30:00"), (1, "date", "2025-03-01"),
+                                (1, "offset", "2025-03-01T12:00:00+05:30"), (1, "bad", "yesterday")])
+    assert res["inserted"] == 3 and [e["row"] for e in res["errors"]] == [3]
+    got = {r["text"]: r["created_at"] for r in app.get_reviews(1)["reviews"]}
+    assert got == {"iso": "2025-03-01 09:30:00", "date": "2025-03-01 00:00:00", "offset": "2025-03-01 06:30:00"}
+    assert page_through(1, 1) == ["date", "offset", "iso"]
@@ -0,0 +1,35 @@
+import Final_codepythonnnnn as app
+
+
+def scores():
+    with app.db_cursor() as (conn, cur):
+        cur.execute("SELECT review_id, sentiment, keywords FROM review_scores ORDER BY review_id")
+        return {r[0]: (r[1], r[2]) for r in cur.fetchall()}
+
+
+def test_score_texts_lexicon_and_negation():
+    sentiment, pos, neg, keywords = app.score_texts(["tasty and fresh", "not good, cold", "plain"])
+    assert sentiment[0] == 1.0 and sentiment[1] == -1.0 and sentiment[2] == 0.0
+    assert (pos, neg) == ([2, 0, 0], [0, 2, 0])
+    assert keywords == ["tasty,fresh", "good,cold", ""]
+
+
+def test_scoring_is_incremental(menu):
+    app.add_reviews_many([(1, "tasty rice"), (1, "stale rice")])
+    res = app.score_new_reviews(batch_size=1)
+    assert (res["status"], res["scored"]) == ("success", 2)
+    assert app.score_new_reviews()["scored"] == 0
+    app.ad(2, "the dal was delicious today")
+    res = app.score_new_reviews()
+    assert res["scored"] == 1 and res["watermark"] == 3
+    assert scores()[3][0] > 0 and scores()[2][0] < 0
+
+
+def test_edited_review_is_rescored_on_request(menu, add_review):
+    rid = add_review(1, "the rice was tasty today")
+    app.score_new_reviews()
+    app.upd_review_by_id(rid, "the rice was stale today")
+    assert rid not in scores()
+    assert app.score_new_reviews()["scored"] == 0   # below the watermark
+    assert app.score_new_reviews(rescore_missing=True)["scored"] == 1
+    assert scores()[rid] == (-1.0, "stale")
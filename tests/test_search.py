@@ -0,0 +1,41 @@
+import pytest
+
+import Final_codepythonnnnn as app
+
+
+@pytest.fixture
+def reviews(menu):
+    app.add_reviews_many([(1, "the rice was cold and stale"), (2, "dal was fresh and hot"),
+                          (3, "roti was cold"), (1, "excellent biryani rice")])
+
+
+def texts(res):
+    assert res["status"] == "success"
+    return [r["text"] for r in res["results"]]
+
+
+def test_search_finds_matching_reviews(reviews):
+    assert sorted(texts(app.search_reviews("cold"))) == ["roti was cold", "the rice was cold and stale"]
+    assert texts(app.search_reviews("biryani")) == ["excellent biryani rice"]
+    assert texts(app.search_reviews("paneer")) == []
+
+
+def test_search_follows_edits_and_deletes(reviews):
+    hit = app.search_reviews("roti")["results"][0]
+    app.upd_review_by_id(hit["review_id"], "roti was warm")
+    assert texts(app.search_reviews("cold")) == ["the rice was cold and stale"]
+    app.del_review_by_id(hit["review_id"])
+    assert texts(app.search_reviews("roti")) == []
+
+
+def test_search_fts_syntax_is_not_injected(reviews):
+    if not app.fts_available:
+        pytest.skip("SQLite built without FTS5")
+    assert sorted(texts(app.search_reviews("bir*"))) == ["excellent biryani rice"]
+    assert len(texts(app.search_reviews("stale OR fresh"))) == 2
+    assert app.search_reviews('"cold" NEAR(')["status"] == "success"
+    assert "[cold]" in app.search_reviews("cold")["results"][0]["snippet"]
+
+
+def test_empty_query_is_an_error():
+    assert app.search_reviews("  ")["status"] == "error"
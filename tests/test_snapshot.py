@@ -0,0 +1,22 @@
+import Final_codepythonnnnn as app
+
+
+def test_snapshot_lookups(menu):
+    snap = app.get_menu_snapshot()["snapshot"]
+    assert len(snap) == 3
+    assert [m["item"] for m in snap.for_slot("Monday", "Lunch")] == ["rice", "dal"]
+    assert snap.for_slot("Sunday", "Lunch") == []
+    assert snap.get(3) == {"id": 3, "day": "Tuesday", "meal": "Dinner", "item": "roti"}
+    assert snap.index_of(4) is None and snap.get(4) is None
+    assert snap.to_dicts() == app.get_full_menu()["menu"]
+
+
+def test_snapshot_follows_menu_writes(menu):
+    first = app.get_menu_snapshot()
+    assert app.get_menu_snapshot()["snapshot"] is first["snapshot"]   # served from the read cache
+    app.upd_menu_fields(2, item="paneer")
+    second = app.get_menu_snapshot()
+    assert second["snapshot"].get(2)["item"] == "paneer"
+    assert second["version"] > first["version"]
+    changes = app.get_changes_since(first["version"])["changes"]
+    assert [(c["id"], c["row"]["item"]) for c in changes] == [(2, "paneer")]
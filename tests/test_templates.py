@@ -0,0 +1,63 @@
+import Final_codepythonnnnn as app
+
+
+def items(menu):
+    return sorted((m["day"], m["meal"], m["item"]) for m in menu)
+
+
+def test_clone_week_to_templates_with_overrides(menu):
+    assert app.clone_week("live", "regular")["status"] == "success"
+    res = app.clone_week("regular", ["hall_a", "hall_b"], overrides={"2": "paneer", 3: None})
+    assert res["written"] == 4
+    assert [(m["id"], m["item"]) for m in app.get_week("hall_b")["menu"]] == [(1, "rice"), (2, "paneer")]
+    assert len(app.get_full_menu()["menu"]) == 3
+
+
+def test_publish_archives_only_replaced_dishes(menu, add_review):
+    app.clone_week("live", "regular", overrides={1: "pulao"})
+    add_review(1, "the rice was soft and fresh")
+    kept = add_review(2, "the dal was thick and hot")
+    preview = app.clone_week("regular", "live", dry_run=True)
+    assert preview["archived_reviews"] == 1
+    assert (preview["diff"]["live"]["added"], preview["diff"]["live"]["removed"]) == (1, 1)
+    assert len(app.get_full_menu()["menu"]) == 3
+
+    res = app.clone_week("regular", "live")
+    assert res["status"] == "success"
+    assert (res["added"], res["removed"], res["unchanged"], res["archived_reviews"]) == (1, 1, 2, 1)
+    menu_now = app.get_full_menu()["menu"]
+    assert [m["item"] for m in menu_now] == ["dal", "roti", "pulao"]
+    assert menu_now[-1]["id"] > 3   # a new id: the old reviews never attach to the new dish
+    assert app.get_reviews(1)["reviews"] == []
+    assert [r["text"] for r in app.get_reviews(1, include_archived=True)["reviews"]] == ["the rice was soft and fresh"]
+    assert [r["review_id"] for r in app.get_reviews(2)["reviews"]] == [kept]
+
+
+def test_publish_leaves_other_slots_alone(menu, add_review):
+    app.add_menu_many([(10, "Monday", "Dinner", "khichdi"), (11, "Friday", "Lunch", "pulao")])
+    app.clone_week("live", "monday_lunch", overrides={3: None, 10: None, 11: None})
+    other = add_review(11, "the pulao had too much salt")
+    app.clone_week("monday_lunch", "lunch_v2", overrides={2: "chole"})
+    res = app.clone_week("lunch_v2", "live")
+    assert (res["added"], res["removed"], res["unchanged"], res["archived_reviews"]) == (1, 1, 1, 0)
+    assert items(app.get_full_menu()["menu"]) == [
+        ("Friday", "Lunch", "pulao"), ("Monday", "Dinner", "khichdi"), ("Monday", "Lunch", "chole"),
+        ("Monday", "Lunch", "rice"), ("Tuesday", "Dinner", "roti")]
+    assert [r["review_id"] for r in app.get_reviews(11)["reviews"]] == [other]
+    assert app.clone_week("lunch_v2", "live")["added"] == 0   # publishing again changes nothing
+
+
+def test_publish_logs_only_affected_rows(menu):
+    app.clone_week("live", "regular", overrides={3: "naan"})
+    start = app.get_changes_since(None)["version"]
+    app.clone_week("regular", "live")
+    changes = app.get_changes_since(start)["changes"]
+    assert sorted((c["op"], c["id"] == 3) for c in changes) == [("delete", True), ("upsert", False)]
+
+
+def test_clone_week_rejects_bad_targets(menu):
+    assert app.clone_week("live", "live")["status"] == "error"
+    assert app.clone_week("missing", "x")["status"] == "error"
+    assert app.clone_week("missing", "live")["status"] == "error"
+    assert app.clone_week("live", ["live", "x"])["status"] == "error"
+    assert app.clone_week("live", "x", password="p")["status"] == "denied"
@@ -0,0 +1,39 @@
+import atexit
+
+import Final_codepythonnnnn as app
+
+
+def test_queued_reviews_flushed_on_shutdown(menu):
+    app.configure_write_behind(True, max_batch=100, max_delay=60)
+    futures = [app.ad_enqueue(2, f"dal review number {i} was fine") for i in range(5)]
+    app.shutdown_backend()
+    assert all(f.result(timeout=5)["status"] == "success" for f in futures)
+    assert len(app.get_reviews(2)["reviews"]) == 5
+
+
+def test_reviews_share_a_commit(menu):
+    app.configure_write_behind(True, max_batch=50, max_delay=0.2)
+    futures = [app.ad_enqueue(1, f"rice review number {i} was fine") for i in range(20)]
+    assert all(f.result(timeout=5)["status"] == "success" for f in futures)
+    assert app.review_queue.written == 20 and app.review_queue.batches < 20
+
+
+def test_bad_row_fails_only_its_own_future(menu):
+    app.configure_write_behind(True, max_batch=50, max_delay=0.2)
+    good = app.ad_enqueue(1, "the rice was fine today")
+    dup = app.ad_enqueue(1, "the rice was fine today")
+    assert good.result(timeout=5)["status"] == "success"
+    assert dup.result(timeout=5)["status"] == "error"
+
+
+def test_exit_hook_registered_once(menu, monkeypatch):
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+    app.configure_write_behind(True, max_batch=10, max_delay=0)
+    for i in range(3):
+        app.ad(1, f"rice review {i} after a restart")
+        app.flush_reviews()   # stops the worker; the next review starts it again
+    assert len(registered) == 1
+    app.configure_write_behind(False)
+    assert registered == []